@@ -1,8 +1,12 @@
+import functools
+import math
 import string
 
 from fastfpe import ff3_1
 from ff3 import FF3Cipher
+from hypothesis import HealthCheck
 from hypothesis import given
+from hypothesis import settings
 from hypothesis import strategies as st
 
 # Unicode character pools for testing multi-byte character handling
@@ -14,6 +18,28 @@ UNICODE_EXTRAS = (
     "あいうえおかきくけこ"  # Japanese Hiragana
 )
 
+POOL = tuple(string.digits + string.ascii_lowercase + UNICODE_EXTRAS)
+
+# alphabets are capped at 12 characters to keep the reference cipher cheap;
+# radix 13 and above is not cross-checked against ff3 here
+MAX_RADIX = 12
+
+# FF3-1 length bounds per radix, computed the same way as the reference implementation:
+# radix^min_len >= 1,000,000 and max_len = 2 * floor(log_radix(2^96))
+_BOUNDS = {
+    radix: (
+        math.ceil(math.log(1_000_000) / math.log(radix)),
+        2 * math.floor(96 / math.log2(radix)),
+    )
+    for radix in range(2, MAX_RADIX + 1)
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _ref(key, tweak, alphabet):
+    # reuse reference ciphers (and their AES key schedules) across repeated draws
+    return FF3Cipher.withCustomAlphabet(key, tweak, alphabet)
+
 
 @st.composite
 def ff3_examples(draw):
@@ -25,28 +51,33 @@ def ff3_examples(draw):
     tweak = draw(st.binary(min_size=7, max_size=7)).hex()
 
     # alphabet: unique characters sampled from digits+lowercase+unicode
-    pool = list(string.digits + string.ascii_lowercase + UNICODE_EXTRAS)
-    alpha_list = draw(st.lists(st.sampled_from(pool), min_size=2, max_size=20, unique=True))
+    alpha_list = draw(st.lists(st.sampled_from(POOL), min_size=2, max_size=MAX_RADIX, unique=True))
     alphabet = "".join(alpha_list)
 
-    # Use the reference implementation's computed bounds to avoid sampling invalid lengths
-    ref_cipher = FF3Cipher.withCustomAlphabet(key, tweak, alphabet)
-    min_len = ref_cipher.minLen
-    max_len = ref_cipher.maxLen
+    min_len, max_len = _BOUNDS[len(alphabet)]
 
     pt_len = draw(st.integers(min_value=min_len, max_value=max_len))
-    pt = "".join(draw(st.lists(st.sampled_from(list(alphabet)), min_size=pt_len, max_size=pt_len)))
+    pt = draw(st.text(alphabet=alpha_list, min_size=pt_len, max_size=pt_len))
 
     return key, tweak, alphabet, pt
 
 
+@settings(max_examples=500, deadline=None)
 @given(ff3_examples())
 def test_hypothesis_roundtrip(example):
     key, tweak, alphabet, pt = example
     ct = ff3_1.encrypt(key, tweak, alphabet, pt)
     assert ff3_1.decrypt(key, tweak, alphabet, ct) == pt
 
-    # cross-check against Python reference implementation
-    py = FF3Cipher.withCustomAlphabet(key, tweak, alphabet)
-    assert py.decrypt(py.encrypt(pt)) == pt
+
+@settings(max_examples=20, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(ff3_examples())
+def test_hypothesis_crosscheck(example):
+    key, tweak, alphabet, pt = example
+    ct = ff3_1.encrypt(key, tweak, alphabet, pt)
+
+    # cross-check against Python reference implementation, which is much slower,
+    # so it runs on fewer examples than the roundtrip test above
+    py = _ref(key, tweak, alphabet)
     assert ct == py.encrypt(pt)
+    assert py.decrypt(ct) == pt